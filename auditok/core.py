@@ -18,16 +18,11 @@ import warnings
 from dataclasses import dataclass, field
 from pathlib import Path
 
+from . import signal
 from .exceptions import AudioParameterError, TooSmallBlockDuration
 from .io import check_audio_data, get_audio_source, player_for, to_file
-from .plotting import plot
 from .util import AudioEnergyValidator, AudioReader, DataValidator
 
-try:
-    from . import signal_numpy as signal
-except ImportError:
-    from . import signal
-
 __all__ = [
     "load",
     "split",
@@ -42,6 +37,30 @@ DEFAULT_ANALYSIS_WINDOW = 0.05
 DEFAULT_ENERGY_THRESHOLD = 50
 _EPSILON = 1e-10
 
+# (long name, short name) pairs of keyword arguments accepted by `split`
+_SPLIT_PARAM_ALIASES = (
+    ("analysis_window", "aw"),
+    ("audio_format", "fmt"),
+    ("max_read", "mr"),
+    ("use_channel", "uc"),
+    ("validator", "val"),
+    ("energy_threshold", "eth"),
+)
+
+
+def _resolve_aliases(kwargs, aliases=_SPLIT_PARAM_ALIASES):
+    """
+    Return a copy of `kwargs` where every short parameter name in `aliases` is
+    replaced by its long name. If both names are present, the long name takes
+    precedence.
+    """
+    kwargs = kwargs.copy()
+    for long_name, short_name in aliases:
+        if short_name in kwargs:
+            value = kwargs.pop(short_name)
+            kwargs.setdefault(long_name, value)
+    return kwargs
+
 
 def load(input, skip=0, max_read=None, **kwargs):
     """
@@ -222,21 +241,18 @@ def split(
     if max_silence < 0:
         raise ValueError(f"'max_silence' ({max_silence}) must be >= 0")
 
+    kwargs = _resolve_aliases(kwargs)
     if isinstance(input, AudioReader):
         source = input
         analysis_window = source.block_dur
     else:
-        analysis_window = kwargs.get(
-            "analysis_window", kwargs.get("aw", DEFAULT_ANALYSIS_WINDOW)
-        )
+        analysis_window = kwargs.get("analysis_window", DEFAULT_ANALYSIS_WINDOW)
         if analysis_window <= 0:
             raise ValueError(
                 f"'analysis_window' ({analysis_window}) must be > 0"
             )
 
         params = kwargs.copy()
-        params["max_read"] = params.get("max_read", params.get("mr"))
-        params["audio_format"] = params.get("audio_format", params.get("fmt"))
         if isinstance(input, AudioRegion):
             params["sampling_rate"] = input.sr
             params["sample_width"] = input.sw
@@ -251,12 +267,12 @@ def split(
             err_msg += "one data sample"
             raise ValueError(err_msg) from exc
 
-    validator = kwargs.get("validator", kwargs.get("val"))
+    validator = kwargs.get("validator")
     if validator is None:
         energy_threshold = kwargs.get(
-            "energy_threshold", kwargs.get("eth", DEFAULT_ENERGY_THRESHOLD)
+            "energy_threshold", DEFAULT_ENERGY_THRESHOLD
         )
-        use_channel = kwargs.get("use_channel", kwargs.get("uc"))
+        use_channel = kwargs.get("use_channel")
         validator = AudioEnergyValidator(
             energy_threshold, source.sw, source.ch, use_channel=use_channel
         )
@@ -531,6 +547,16 @@ def _read_offline(input, skip=0, max_read=None, **kwargs):
     )
 
 
+def plot(*args, **kwargs):
+    """
+    Call :func:`auditok.plotting.plot`, importing the module (and matplotlib,
+    which is slow to import) on first call rather than with this module.
+    """
+    from .plotting import plot
+
+    return plot(*args, **kwargs)
+
+
 def _check_convert_index(index, types, err_msg):
     if not isinstance(index, slice) or index.step is not None:
         raise TypeError(err_msg)
@@ -863,7 +889,7 @@ class AudioRegion(object):
         description of split parameters.
         See Also :meth:`AudioRegio.split_and_plot`.
         """
-        if kwargs.get("max_read", kwargs.get("mr")) is not None:
+        if _resolve_aliases(kwargs).get("max_read") is not None:
             warn_msg = "'max_read' (or 'mr') should not be used with "
             warn_msg += "AudioRegion.split_and_plot(). You should rather "
             warn_msg += "slice audio region before calling this method"
@@ -954,8 +980,8 @@ class AudioRegion(object):
         )
         regions = list(regions)
         detections = ((reg.meta.start, reg.meta.end) for reg in regions)
-        eth = kwargs.get(
-            "energy_threshold", kwargs.get("eth", DEFAULT_ENERGY_THRESHOLD)
+        eth = _resolve_aliases(kwargs).get(
+            "energy_threshold", DEFAULT_ENERGY_THRESHOLD
         )
         plot(
             self,
@@ -16,6 +16,7 @@ Module for low-level audio input-output operations.
     player_for
 """
 
+import mmap
 import os
 import sys
 import wave
@@ -223,6 +224,32 @@ class AudioSource(ABC):
             samples
         """
 
+    def readinto(self, buffer):
+        """Read audio samples into a pre-allocated writable buffer.
+
+        Reads as many samples as `buffer` can hold, or the remaining samples
+        if fewer are available. This default implementation copies the data
+        returned by :meth:`read`. Subclasses that can read directly into
+        `buffer` should override it.
+
+        Parameters
+        ----------
+        buffer : bytearray or memoryview
+            A writable buffer of bytes.
+
+        Returns
+        -------
+        int
+            The number of bytes written to `buffer`, 0 if no more data is
+            available.
+        """
+        data = self.read(len(buffer) // (self.sample_width * self.channels))
+        if not data:
+            return 0
+        size = len(data)
+        buffer[:size] = data
+        return size
+
     @property
     def sampling_rate(self):
         """Number of samples per second of audio stream."""
@@ -342,6 +369,7 @@ class BufferAudioSource(Rewindable):
         super().__init__(sampling_rate, sample_width, channels)
         check_audio_data(data, sample_width, channels)
         self._data = data
+        self._data_view = None
         self._sample_size_all_channels = sample_width * channels
         self._current_position_bytes = 0
         self._is_open = False
@@ -370,6 +398,19 @@ class BufferAudioSource(Rewindable):
             return data
         return None
 
+    def readinto(self, buffer):
+        if not self._is_open:
+            raise AudioIOError("Stream is not open")
+        if self._data_view is None:
+            self._data_view = memoryview(self._data)
+        start = self._current_position_bytes
+        end = start + len(buffer) - len(buffer) % self._sample_size_all_channels
+        data = self._data_view[start:end]
+        size = len(data)
+        buffer[:size] = data
+        self._current_position_bytes += size
+        return size
+
     @property
     def data(self):
         """Get raw audio data as a `bytes` object."""
@@ -458,7 +499,19 @@ class RawAudioSource(FileAudioSource):
     An `AudioSource` class for reading data from a raw (headerless) audio file.
 
     This class is suitable for large raw audio files, allowing for efficient
-    data handling without loading the entire file into memory.
+    data handling without loading the entire file into memory. The file is
+    memory-mapped when possible, data is then read from the OS page cache
+    without a system call for each read. Files that can't be mapped (e.g.,
+    pipes) are read with regular file reads.
+
+    A memory-mapped file behaves differently from a file read with regular
+    reads if it is modified while the source is open:
+
+    - the mapping covers the size of the file when `open` is called, data
+      appended to the file afterwards is not read.
+    - truncating the file while it is mapped makes reading past its new end
+      raise a `SIGBUS` signal, which terminates the process, instead of
+      returning less data.
 
     Parameters
     ----------
@@ -480,7 +533,18 @@ class RawAudioSource(FileAudioSource):
 
     def open(self):
         if self._audio_stream is None:
-            self._audio_stream = open(self._filename, "rb")
+            fp = open(self._filename, "rb")
+            try:
+                stream = mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ)
+            except (OSError, ValueError):
+                # empty file or file that can't be mapped (e.g., a pipe)
+                self._audio_stream = fp
+                return
+            # the mapping remains valid after the file is closed
+            fp.close()
+            if hasattr(mmap, "MADV_SEQUENTIAL"):
+                stream.madvise(mmap.MADV_SEQUENTIAL)
+            self._audio_stream = stream
 
     def _read_from_stream(self, size):
         if size is None or size < 0:
@@ -490,6 +554,20 @@ class RawAudioSource(FileAudioSource):
         data = self._audio_stream.read(bytes_to_read)
         return data
 
+    def readinto(self, buffer):
+        if not self.is_open():
+            raise AudioIOError("Audio stream is not open")
+        extra_bytes = len(buffer) % self._sample_size
+        if extra_bytes:
+            buffer = memoryview(buffer)[:-extra_bytes]
+        if isinstance(self._audio_stream, mmap.mmap):
+            # mmap objects have no readinto method
+            data = self._audio_stream.read(len(buffer))
+            size = len(data)
+            buffer[:size] = data
+            return size
+        return self._audio_stream.readinto(buffer)
+
 
 class WaveAudioSource(FileAudioSource):
     """
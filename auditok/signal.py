@@ -110,8 +110,14 @@ def calculate_energy(x, agg_fn=None):
         None, this will be an array of energies, one per channel.
     """
 
-    x = np.array(x).astype(np.float64)
-    energy_sqrt = np.sqrt(np.mean(x**2, axis=-1))
+    x = np.asarray(x)
+    # sum of squares in a single pass over data, without a temporary array.
+    # Unsafe casting converts any input (e.g., np.longdouble) to float64 the
+    # same way `astype(np.float64)` does
+    sum_square = np.einsum(
+        "...i,...i->...", x, x, dtype=np.float64, casting="unsafe"
+    )
+    energy_sqrt = np.sqrt(sum_square / x.shape[-1])
     energy_sqrt = np.clip(energy_sqrt, a_min=EPSILON, a_max=None)
     energy = 20 * np.log10(energy_sqrt)
     if agg_fn is not None:
@@ -0,0 +1,82 @@
+"""
+Module for signal processing kernels compiled with Numba.
+
+These kernels compute the mean of squared audio samples in a single pass over
+integer data, without allocating intermediate arrays. They are used by
+:class:`auditok.util.AudioEnergyValidator` for multichannel data when it is
+created with `use_numba=True`, which requires `numba`
+(https://numba.pydata.org/). Compiling them takes about 1 s the first time
+(compiled code is cached for later processes).
+
+.. autosummary::
+    :toctree: generated/
+
+    max_channel_mean_square
+    mix_mean_square
+"""
+
+import math
+
+import numpy as np
+from numba import njit
+
+__all__ = [
+    "max_channel_mean_square",
+    "mix_mean_square",
+]
+
+
+@njit(cache=True)
+def max_channel_mean_square(x):
+    """
+    Compute the mean of squared samples of each channel and return the
+    highest one.
+
+    Parameters
+    ----------
+    x : numpy.ndarray
+        A 2-D array of integer audio samples of shape
+        (number of samples, number of channels).
+
+    Returns
+    -------
+    float
+        The highest mean of squared samples among all channels.
+    """
+    nb_samples, channels = x.shape
+    if nb_samples == 0:
+        return math.nan
+    totals = np.zeros(channels)
+    for i in range(nb_samples):
+        for c in range(channels):
+            v = float(x[i, c])
+            totals[c] += v * v
+    return totals.max() / nb_samples
+
+
+@njit(cache=True)
+def mix_mean_square(x):
+    """
+    Compute the mean of squared samples of the average of all channels.
+
+    Parameters
+    ----------
+    x : numpy.ndarray
+        A 2-D array of integer audio samples of shape
+        (number of samples, number of channels).
+
+    Returns
+    -------
+    float
+        The mean of squared samples of the average channel.
+    """
+    nb_samples, channels = x.shape
+    if nb_samples == 0:
+        return math.nan
+    total = 0.0
+    for i in range(nb_samples):
+        s = 0.0
+        for c in range(channels):
+            s += float(x[i, c])
+        total += s * s
+    return total / (nb_samples * channels * channels)
@@ -11,8 +11,12 @@ Module for high-level audio input-output operations.
     make_channel_selector
 """
 
+import math
+import weakref
 from abc import ABC, abstractmethod
-from functools import partial
+from functools import lru_cache, partial
+from queue import Empty, Full, Queue
+from threading import Event, Thread
 
 import numpy as np
 
@@ -96,7 +100,12 @@ def make_duration_formatter(fmt):
             formatter(3723.25)
             # '02 min, 03 sec and 250 ms'
     """
+    return _make_duration_formatter(fmt)
 
+
+@lru_cache(maxsize=32)
+def _make_duration_formatter(fmt):
+    # formatters are stateless, so the same one is returned for a given `fmt`
     if fmt == "%S":
 
         def formatter(seconds):
@@ -108,10 +117,10 @@ def make_duration_formatter(fmt):
             return "{0}".format(int(seconds * 1000))
 
     else:
-        fmt = fmt.replace("%h", "{hrs:02d}")
-        fmt = fmt.replace("%m", "{mins:02d}")
-        fmt = fmt.replace("%s", "{secs:02d}")
-        fmt = fmt.replace("%i", "{millis:03d}")
+        fmt = fmt.replace("%h", "{0:02d}")
+        fmt = fmt.replace("%m", "{1:02d}")
+        fmt = fmt.replace("%s", "{2:02d}")
+        fmt = fmt.replace("%i", "{3:03d}")
         try:
             i = fmt.index("%")
             raise TimeFormatError(
@@ -120,12 +129,14 @@ def make_duration_formatter(fmt):
         except ValueError:
             pass
 
+        format_ = fmt.format
+
         def formatter(seconds):
             millis = int(seconds * 1000)
             hrs, millis = divmod(millis, 3600000)
             mins, millis = divmod(millis, 60000)
             secs, millis = divmod(millis, 1000)
-            return fmt.format(hrs=hrs, mins=mins, secs=secs, millis=millis)
+            return format_(hrs, mins, secs, millis)
 
     return formatter
 
@@ -140,13 +151,15 @@ def make_channel_selector(sample_width, channels, selected=None):
     list of available channels: `[data_channel_1, data_channel_2, ...]`.
 
     Note that `selector` expects input data in `bytes` format but does not
-    necessarily return a `bytes` object. To select or compute the desired
-    channel (or average channel if `selected="avg"`), it converts the input
-    data into an `array.array` or `numpy.ndarray`. After selection, the data
-    is returned as is, without reconversion to `bytes`, for efficiency. The
-    output can be converted back to `bytes` with `bytes(obj)` if needed.
+    necessarily return a `bytes` object. To select the desired channel, it
+    reinterprets the input data as a read-only `numpy.ndarray` of integer
+    samples, without copying it, and returns a strided view on that array.
+    Only the average channel (`selected="avg"`) is computed into a new array
+    of `numpy.float64`. The output can be converted back to `bytes` with
+    `bytes(obj)` if needed.
 
-    Special case: If `channels=1`, the input data is returned without processing.
+    Special case: If `channels=1`, the input data is returned as a 2-D array
+    of shape (1, number of samples), whatever the value of `selected`.
 
     Parameters
     ----------
@@ -172,11 +185,82 @@ def make_channel_selector(sample_width, channels, selected=None):
         If `sample_width` is not one of {1, 2, 4}, or if `selected` has an
         unsupported value.
     """
-    to_array_ = partial(
-        signal.to_array, sample_width=sample_width, channels=channels
-    )
-    if channels == 1 or selected in (None, "any"):
-        return to_array_
+    if channels == 1:
+        selected = None
+    else:
+        selected = _normalize_selected_channel(channels, selected)
+    return _make_channel_selector(sample_width, channels, selected)
+
+
+@lru_cache(maxsize=32)
+def _make_channel_selector(sample_width, channels, selected):
+    # selectors are stateless, so the same one is returned for a given
+    # (sample_width, channels, normalized `selected`) combination.
+    # Selector arguments are bound as default parameter values, they are then
+    # local variables of each call, which is the fastest lookup in CPython.
+    dtype = signal._get_numpy_dtype(sample_width)
+    if channels == 1:
+
+        def selector(data, _frombuffer=np.frombuffer, _dtype=dtype):
+            return _frombuffer(data, _dtype).reshape(1, -1)
+
+        return selector
+
+    if selected is None:
+
+        def selector(
+            data, _frombuffer=np.frombuffer, _dtype=dtype, _channels=channels
+        ):
+            return _frombuffer(data, _dtype).reshape(-1, _channels).T
+
+    elif selected == "mix":
+
+        def selector(
+            data, _frombuffer=np.frombuffer, _dtype=dtype, _channels=channels
+        ):
+            x = _frombuffer(data, _dtype).reshape(-1, _channels)
+            return _sum_channels(x) / _channels
+
+    else:
+
+        def selector(
+            data,
+            _frombuffer=np.frombuffer,
+            _dtype=dtype,
+            _channels=channels,
+            _selected=selected,
+        ):
+            return _frombuffer(data, _dtype)[_selected::_channels]
+
+    return selector
+
+
+def _sum_channels(x):
+    """
+    Sum the channels of a 2-D array of integer samples of shape
+    (number of samples, number of channels).
+
+    Channels are added column by column into a `numpy.float64` array (sums are
+    exact for any sample width). This is several times faster than a reduction
+    along the last axis (e.g., `x.sum(axis=1)`), which is slow for a very
+    small number of elements per row.
+    """
+    total = x[:, 0].astype(np.float64)
+    for channel in range(1, x.shape[1]):
+        total += x[:, channel]
+    return total
+
+
+def _normalize_selected_channel(channels, selected):
+    """
+    Check a channel selection value and return its normalized form: None for
+    any channel, "mix" for the average channel or a non-negative channel index.
+    """
+    if selected in (None, "any"):
+        return None
+
+    if selected in ("mix", "avg", "average"):
+        return "mix"
 
     if isinstance(selected, int):
         if selected < 0:
@@ -185,10 +269,7 @@ def make_channel_selector(sample_width, channels, selected=None):
             err_msg = "Selected channel must be >= -channels and < channels"
             err_msg += ", given: {}"
             raise ValueError(err_msg.format(selected))
-        return lambda x: to_array_(x)[selected]
-
-    if selected in ("mix", "avg", "average"):
-        return lambda x: to_array_(x).mean(axis=0)
+        return selected
 
     raise ValueError(
         "Selected channel must be an integer, None (alias 'any') or 'average' "
@@ -196,6 +277,21 @@ def make_channel_selector(sample_width, channels, selected=None):
     )
 
 
+@lru_cache(maxsize=1)
+def _load_signal_numba():
+    """
+    Import and return the `signal_numba` module, or None if `numba` is not
+    installed. `numba` is slow to import, so this is only done the first time
+    a multichannel :class:`AudioEnergyValidator` is created with
+    `use_numba=True`.
+    """
+    try:
+        from . import signal_numba
+    except ImportError:
+        return None
+    return signal_numba
+
+
 class DataSource(ABC):
     """
     Base class for objects used as data sources in
@@ -228,6 +324,8 @@ class DataValidator(ABC):
     specific criteria for data validity.
     """
 
+    __slots__ = ()
+
     @abstractmethod
     def is_valid(self, data):
         """
@@ -273,22 +371,82 @@ class AudioEnergyValidator(DataValidator):
         - int (0 <= value < `channels`): Compute energy for the specified channel
           only, ignoring others.
 
+    use_numba : bool, default=False
+        If True, compute the energy of multichannel data, when `use_channel` is
+        None, "any" or "mix", with kernels compiled by `numba`. This saves a
+        few microseconds per window but has a one-time cost: importing `numba`
+        takes about 0.3 s, and compiling the kernels for a sample width takes
+        about 1 s the first time, or about 0.2 s in later processes when
+        compiled code is read from cache. It only pays off for long streams
+        (tens of minutes of audio). Ignored for single-channel data or when a
+        single channel is selected.
+
     Returns
     -------
     energy : float
         Computed energy of the audio window, used to validate if the window
         meets the `energy_threshold`.
+
+    Raises
+    ------
+    ImportError
+        If `use_numba` is True and `numba` is not installed.
     """
 
+    __slots__ = (
+        "_energy_threshold",
+        "_sample_width",
+        "_dtype",
+        "_channels",
+        "_selected",
+        "_linear_threshold",
+        "_mean_square",
+        "_kernel",
+    )
+
     def __init__(
-        self, energy_threshold, sample_width, channels, use_channel=None
+        self,
+        energy_threshold,
+        sample_width,
+        channels,
+        use_channel=None,
+        use_numba=False,
     ):
         self._energy_threshold = energy_threshold
         self._sample_width = sample_width
-        self._selector = make_channel_selector(
-            sample_width, channels, use_channel
-        )
-        self._energy_agg_fn = np.max if use_channel in (None, "any") else None
+        self._dtype = signal._get_numpy_dtype(sample_width)
+        self._channels = channels
+        if channels == 1:
+            self._selected = 0
+        else:
+            self._selected = _normalize_selected_channel(channels, use_channel)
+        # Energy is monotonic in the mean of squared samples, so compare the
+        # latter to a threshold converted once here instead of taking a log
+        # for every window. signal.calculate_energy clips energy at
+        # 20 * log10(EPSILON), hence any threshold below that always passes.
+        if energy_threshold <= 20 * math.log10(signal.EPSILON):
+            self._linear_threshold = 0
+        else:
+            try:
+                self._linear_threshold = 10 ** (energy_threshold / 10)
+            except OverflowError:
+                self._linear_threshold = math.inf
+
+        if isinstance(self._selected, int):
+            self._mean_square = self._single_channel_mean_square
+            return
+
+        if not use_numba:
+            self._mean_square = self._multichannel_mean_square
+            return
+        signal_numba = _load_signal_numba()
+        if signal_numba is None:
+            raise ImportError("numba is required when 'use_numba' is True")
+        if self._selected == "mix":
+            self._kernel = signal_numba.mix_mean_square
+        else:
+            self._kernel = signal_numba.max_channel_mean_square
+        self._mean_square = self._multichannel_mean_square_numba
 
     def is_valid(self, data):
         """
@@ -306,10 +464,129 @@ class AudioEnergyValidator(DataValidator):
             the specified threshold; otherwise, False.
         """
 
-        log_energy = signal.calculate_energy(
-            self._selector(data), self._energy_agg_fn
-        )
-        return log_energy >= self._energy_threshold
+        return bool(self._mean_square(data) >= self._linear_threshold)
+
+    def get_log_energy(self, data):
+        """
+        Compute the energy of the audio data as seen by :meth:`is_valid`, i.e.,
+        using the channel(s) selected by `use_channel`. Useful to choose an
+        appropriate `energy_threshold`.
+
+        Parameters
+        ----------
+        data : bytes-like
+            An array of raw audio data.
+
+        Returns
+        -------
+        float
+            The log energy of the audio data. For `use_channel=None`, this is
+            the highest energy among all channels.
+        """
+        mean_square = max(self._mean_square(data), signal.EPSILON**2)
+        return 10 * math.log10(mean_square)
+
+    def is_valid_batch(self, data, block_size, hop_size=None):
+        """
+        Determine if each window of a buffer of audio data meets the energy
+        threshold, in one call.
+
+        Windows are laid out as by an :class:`AudioReader` reading `data` with
+        the same block and hop sizes: the i-th window starts at sample
+        `i * hop_size` and has `block_size` samples, except for the last one(s)
+        if remaining data is insufficient. The result for each window is the
+        same as that of :meth:`is_valid`, but samples are squared only once
+        even if windows overlap, and no Python code is run per window.
+
+        Parameters
+        ----------
+        data : bytes-like
+            An array of raw audio data.
+        block_size : int
+            Number of samples (per channel) of each window.
+        hop_size : int, optional
+            Number of samples between the starts of two consecutive windows,
+            should be in range [1, `block_size`]. If None (default), it is set
+            to `block_size` (i.e., windows do not overlap).
+
+        Returns
+        -------
+        numpy.ndarray
+            A 1-D boolean array with the validity of each window.
+
+        Raises
+        ------
+        ValueError
+            If `block_size` or `hop_size` has an invalid value.
+        """
+        if hop_size is None:
+            hop_size = block_size
+        if block_size < 1 or not 1 <= hop_size <= block_size:
+            raise ValueError(
+                "Expected 1 <= hop_size <= block_size, given: "
+                "block_size={}, hop_size={}".format(block_size, hop_size)
+            )
+        x = np.frombuffer(data, dtype=self._dtype).reshape(-1, self._channels)
+        nb_samples = x.shape[0]
+        if nb_samples == 0:
+            return np.zeros(0, dtype=bool)
+
+        # a trailing zero row keeps every index used by reduceat below in
+        # range. Squares of 1- and 2-byte samples, and their sums over a
+        # window, are exact in float64 (squares of 4-byte samples may not).
+        if isinstance(self._selected, int):
+            x = x[:, self._selected].astype(np.float64)
+            squares = np.zeros(nb_samples + 1)
+            np.multiply(x, x, out=squares[:-1])
+            scale = 1
+        elif self._selected == "mix":
+            x = _sum_channels(x)
+            squares = np.zeros(nb_samples + 1)
+            np.multiply(x, x, out=squares[:-1])
+            scale = self._channels**2
+        else:
+            x = x.astype(np.float64)
+            squares = np.zeros((nb_samples + 1, self._channels))
+            np.multiply(x, x, out=squares[:-1])
+            scale = 1
+
+        nb_windows = 1 - (-max(nb_samples - block_size, 0) // hop_size)
+        starts = np.arange(nb_windows) * hop_size
+        ends = np.minimum(starts + block_size, nb_samples)
+        # reduceat sums squares[indices[k]:indices[k + 1]], so interleaving
+        # starts and ends yields the sum of each window at even positions
+        indices = np.empty(2 * nb_windows, dtype=np.intp)
+        indices[0::2] = starts
+        indices[1::2] = ends
+        sum_square = np.add.reduceat(squares, indices, axis=0)[0::2]
+        if sum_square.ndim == 2:
+            sum_square = sum_square.max(axis=1)
+        mean_square = sum_square / ((ends - starts) * scale)
+        return mean_square >= self._linear_threshold
+
+    def _single_channel_mean_square(self, data):
+        x = np.frombuffer(data, dtype=self._dtype)
+        if self._channels > 1:
+            x = x[self._selected :: self._channels]
+        x = x.astype(np.float64)
+        return x.dot(x) / x.size
+
+    def _multichannel_mean_square(self, data):
+        # zero-copy (frames, channels) view of interleaved samples
+        x = np.frombuffer(data, dtype=self._dtype).reshape(-1, self._channels)
+        if self._selected == "mix":
+            # mean square of the average channel, from the sum of channels
+            x = _sum_channels(x)
+            return x.dot(x) / (x.size * self._channels**2)
+        # one sum of squares per channel, computed in a single pass without a
+        # temporary array of squares. The window is valid if any channel
+        # reaches the threshold.
+        sum_square = np.einsum("ij,ij->j", x, x, dtype=np.float64)
+        return sum_square.max() / x.shape[0]
+
+    def _multichannel_mean_square_numba(self, data):
+        x = np.frombuffer(data, dtype=self._dtype).reshape(-1, self._channels)
+        return self._kernel(x)
 
 
 class StringDataSource(DataSource):
@@ -367,6 +644,11 @@ class _AudioReadingProxy:
     def __init__(self, audio_source):
 
         self._audio_source = audio_source
+        # audio parameters are used to read every window: store them as
+        # instance attributes instead of forwarding them with __getattr__
+        self.sr = self.sampling_rate = audio_source.sr
+        self.sw = self.sample_width = audio_source.sw
+        self.ch = self.channels = audio_source.ch
 
     def rewind(self):
         if self.rewindable:
@@ -392,6 +674,9 @@ class _AudioReadingProxy:
     def read(self, size):
         return self._audio_source.read(size)
 
+    def readinto(self, buffer):
+        return self._audio_source.readinto(buffer)
+
     @property
     def data(self):
         err_msg = "This AudioReader is not a recorder, no recorded data can "
@@ -412,7 +697,7 @@ class _Recorder(_AudioReadingProxy):
 
     def __init__(self, audio_source):
         super().__init__(audio_source)
-        self._cache = []
+        self._cache = bytearray()
         self._read_block = self._read_and_cache
         self._read_from_cache = False
         self._data = None
@@ -435,7 +720,8 @@ class _Recorder(_AudioReadingProxy):
         if self._read_from_cache:
             self._audio_source.rewind()
         else:
-            self._data = b"".join(self._cache)
+            # BufferAudioSource returns slices of its data, keep them bytes
+            self._data = bytes(self._cache)
             self._cache = None
             self._audio_source = BufferAudioSource(
                 self._data, self.sr, self.sw, self.ch
@@ -444,11 +730,23 @@ class _Recorder(_AudioReadingProxy):
             self.open()
             self._read_from_cache = True
 
+    def readinto(self, buffer):
+        size = self._audio_source.readinto(buffer)
+        if size and not self._read_from_cache:
+            self._cache += memoryview(buffer)[:size]
+        return size
+
+    def truncate(self, size):
+        # drop data recorded after the first `size` bytes, used by readers
+        # that read more data than they return
+        if not self._read_from_cache:
+            del self._cache[size:]
+
     def _read_and_cache(self, size):
         # Read and save read data
         block = self._audio_source.read(size)
         if block is not None:
-            self._cache.append(block)
+            self._cache += block
         return block
 
 
@@ -463,33 +761,45 @@ class _Limiter(_AudioReadingProxy):
     def __init__(self, audio_source, max_read):
         super().__init__(audio_source)
         self._max_read = max_read
-        self._max_samples = round(max_read * self.sr)
         self._bytes_per_sample = self.sw * self.ch
-        self._read_samples = 0
+        self._max_read_bytes = (
+            round(max_read * self.sr) * self._bytes_per_sample
+        )
+        self._remaining_bytes = self._max_read_bytes
 
     @property
     def data(self):
-        data = self._audio_source.data
-        max_read_bytes = self._max_samples * self._bytes_per_sample
-        return data[:max_read_bytes]
+        return self._audio_source.data[: self._max_read_bytes]
 
     @property
     def max_read(self):
         return self._max_read
 
     def read(self, size):
-        size = min(self._max_samples - self._read_samples, size)
-        if size <= 0:
-            return None
+        if size * self._bytes_per_sample > self._remaining_bytes:
+            size = self._remaining_bytes // self._bytes_per_sample
+            if size <= 0:
+                return None
         block = self._audio_source.read(size)
         if block is None:
             return None
-        self._read_samples += len(block) // self._bytes_per_sample
+        self._remaining_bytes -= len(block)
         return block
 
+    def readinto(self, buffer):
+        buffer = memoryview(buffer)
+        if len(buffer) > self._remaining_bytes:
+            size = self._remaining_bytes
+            buffer = buffer[: size - size % self._bytes_per_sample]
+            if not buffer:
+                return 0
+        size = self._audio_source.readinto(buffer)
+        self._remaining_bytes -= size
+        return size
+
     def rewind(self):
         super().rewind()
-        self._read_samples = 0
+        self._remaining_bytes = self._max_read_bytes
 
 
 class _FixedSizeAudioReader(_AudioReadingProxy):
@@ -513,10 +823,52 @@ class _FixedSizeAudioReader(_AudioReadingProxy):
             raise TooSmallBlockDuration(
                 err_msg.format(block_dur, self.sr), block_dur, self.sr
             )
+        self._block_size_bytes = self._block_size * self.sw * self.ch
+        # buffer used by read_view, created by its first call
+        self._buffer = None
+        self._view = None
 
     def read(self):
         return self._audio_source.read(self._block_size)
 
+    def read_view(self):
+        """
+        Read a window of audio data and return it as a read-only `memoryview`,
+        or None if no more data is available.
+
+        Data is read, with the `readinto` method of the source, into a buffer
+        owned by this reader, without allocating a new `bytes` object. The
+        returned view is only valid until the next call to `read_view`, use
+        `bytes(view)` to keep a copy of it. With Python 3.7, the view is not
+        read-only.
+        """
+        if self._buffer is None:
+            # writing to a memoryview is faster than writing to a bytearray
+            self._buffer = memoryview(bytearray(self._block_size_bytes))
+            try:
+                self._view = self._buffer.toreadonly()
+            except AttributeError:
+                # Python 3.7: memoryview.toreadonly is not available
+                self._view = self._buffer
+        size = self._audio_source.readinto(self._buffer)
+        if size == self._block_size_bytes:
+            return self._view
+        if not size:
+            return None
+        return self._view[:size]
+
+    def read_batch(self, nb_windows):
+        data = self._audio_source.read(nb_windows * self._block_size)
+        if data is None:
+            return None
+        block_size_bytes = self._block_size_bytes
+        if len(data) <= block_size_bytes:
+            return [data]
+        return [
+            data[i : i + block_size_bytes]
+            for i in range(0, len(data), block_size_bytes)
+        ]
+
     @property
     def block_size(self):
         return self._block_size
@@ -546,42 +898,70 @@ class _OverlapAudioReader(_FixedSizeAudioReader):
         super().__init__(audio_source, block_dur)
 
         self._hop_size = int(hop_dur * self.sr)
-        self._blocks = self._iter_blocks_with_overlap()
-
-    def _iter_blocks_with_overlap(self):
-        while not self.is_open():
-            yield AudioIOError
-        block = self._audio_source.read(self._block_size)
-        if block is None:
-            yield None
-
-        _hop_size_bytes = (
-            self._hop_size * self._audio_source.sw * self._audio_source.ch
-        )
-        cache = block[_hop_size_bytes:]
-        yield block
-
-        while True:
-            block = self._audio_source.read(self._hop_size)
-            if block:
-                block = cache + block
-                cache = block[_hop_size_bytes:]
-                yield block
-                continue
-            yield None
+        self._hop_size_bytes = self._hop_size * self.sw * self.ch
+        # holds the last returned window, its first _hop_size_bytes are
+        # dropped and the next hop appended to make the next window. None
+        # until the first window is read.
+        self._window = None
 
     def read(self):
-        try:
-            block = next(self._blocks)
-            if block == AudioIOError:
+        window = self._window
+        if window is None:
+            if not self.is_open():
                 raise AudioIOError("Audio Stream is not open.")
+            block = self._audio_source.read(self._block_size)
+            if block is not None:
+                self._window = bytearray(block)
             return block
-        except StopIteration:
+
+        block = self._audio_source.read(self._hop_size)
+        if not block:
             return None
+        # deleting a bytearray's head only moves its start offset
+        del window[: self._hop_size_bytes]
+        window += block
+        return bytes(window)
+
+    def read_batch(self, nb_windows):
+        hop_size_bytes = self._hop_size_bytes
+        window = self._window
+        if window is None:
+            if not self.is_open():
+                raise AudioIOError("Audio Stream is not open.")
+            data = self._audio_source.read(
+                self._block_size + (nb_windows - 1) * self._hop_size
+            )
+            if data is None:
+                return None
+            # the first window is read entirely, each next one adds a hop
+            nb_hops = -(
+                -max(len(data) - self._block_size_bytes, 0) // hop_size_bytes
+            )
+            nb_windows = 1 + nb_hops
+        else:
+            data = self._audio_source.read(nb_windows * self._hop_size)
+            if not data:
+                return None
+            nb_windows = -(-len(data) // hop_size_bytes)
+            # windows overlap the tail of the last returned one
+            data = b"".join((window[hop_size_bytes:], data))
+        block_size_bytes = self._block_size_bytes
+        windows = [
+            data[i : i + block_size_bytes]
+            for i in range(0, nb_windows * hop_size_bytes, hop_size_bytes)
+        ]
+        self._window = bytearray(windows[-1])
+        return windows
+
+    def read_view(self):
+        block = self.read()
+        if block is None:
+            return None
+        return memoryview(block)
 
     def rewind(self):
         super().rewind()
-        self._blocks = self._iter_blocks_with_overlap()
+        self._window = None
 
     @property
     def hop_size(self):
@@ -595,6 +975,145 @@ class _OverlapAudioReader(_FixedSizeAudioReader):
         return getattr(self._audio_source, name)
 
 
+class _PrefetchAudioReader(_AudioReadingProxy):
+    """
+    A class for `AudioReader` objects that reads audio windows ahead of time
+    in a background thread.
+
+    Useful for live audio sources (e.g., microphone), where reading a window
+    blocks until enough audio is captured: the next windows are read while
+    the current one is processed. At most `prefetch` windows are read ahead,
+    a consumer that falls behind makes the background thread wait. Windows
+    read ahead are dropped on `rewind` and `close`. If `recorder` is given,
+    data of dropped windows is removed from it, so that only windows returned
+    by `read` are recorded. The background thread only refers to the
+    source, not to this reader. If the reader is garbage collected without
+    being closed, e.g. when a caller stops iterating early, the thread stops
+    within `_PUT_TIMEOUT` seconds.
+    """
+
+    # how often, in seconds, a thread waiting for room in the queue checks
+    # whether it should stop
+    _PUT_TIMEOUT = 0.05
+
+    def __init__(self, audio_source, prefetch, recorder=None):
+        super().__init__(audio_source)
+        if prefetch < 1:
+            raise ValueError(
+                "prefetch must be >= 1, given: {}".format(prefetch)
+            )
+        self._recorder = recorder
+        # amount of source data in windows returned by read, each window but
+        # the first one only adds a hop to the previous one
+        self._returned_bytes = 0
+        self._overlap_bytes = 0
+        hop_size = getattr(audio_source, "hop_size", audio_source.block_size)
+        self._window_overlap_bytes = (
+            (audio_source.block_size - hop_size) * self.sw * self.ch
+        )
+        self._queue = Queue(maxsize=prefetch)
+        self._stop_event = Event()
+        self._thread = None
+        # stop the thread if this reader is collected without being closed
+        weakref.finalize(self, self._stop_event.set)
+
+    @staticmethod
+    def _read_ahead(read, queue, stop_event, timeout):
+        # runs in the background thread, it must not hold a reference to the
+        # reader, otherwise the reader could never be garbage collected
+        while not stop_event.is_set():
+            try:
+                block = read()
+            except Exception as exc:
+                # raised in the consumer thread by the next call to read()
+                block = exc
+            while True:
+                try:
+                    queue.put(block, timeout=timeout)
+                    break
+                except Full:
+                    if stop_event.is_set():
+                        return
+            if block is None or isinstance(block, Exception):
+                return
+
+    def _stop_reading_ahead(self):
+        if self._thread is None:
+            return
+        self._stop_event.set()
+        # keep emptying the queue so that the thread is never stuck on put()
+        while self._thread.is_alive():
+            try:
+                self._queue.get(timeout=0.01)
+            except Empty:
+                pass
+        self._thread.join()
+        self._thread = None
+        self._stop_event.clear()
+        while True:
+            try:
+                self._queue.get_nowait()
+            except Empty:
+                break
+        if self._recorder is not None:
+            # windows read ahead and dropped must not be recorded
+            self._recorder.truncate(self._returned_bytes)
+
+    def read(self):
+        if self._thread is None:
+            self._thread = Thread(
+                target=self._read_ahead,
+                args=(
+                    self._audio_source.read,
+                    self._queue,
+                    self._stop_event,
+                    self._PUT_TIMEOUT,
+                ),
+                daemon=True,
+            )
+            self._thread.start()
+        block = self._queue.get()
+        if block is None or isinstance(block, Exception):
+            # the thread has returned, start a new one on next call
+            self._thread.join()
+            self._thread = None
+            if block is not None:
+                raise block
+        elif self._recorder is not None:
+            self._returned_bytes += len(block) - self._overlap_bytes
+            self._overlap_bytes = self._window_overlap_bytes
+        return block
+
+    def read_view(self):
+        block = self.read()
+        if block is None:
+            return None
+        return memoryview(block)
+
+    def read_batch(self, nb_windows):
+        # windows are already read one by one by the background thread
+        windows = []
+        for _ in range(nb_windows):
+            block = self.read()
+            if block is None:
+                break
+            windows.append(block)
+        return windows or None
+
+    def rewind(self):
+        self._stop_reading_ahead()
+        self._audio_source.rewind()
+        self._returned_bytes = 0
+        self._overlap_bytes = 0
+
+    def close(self):
+        self._stop_reading_ahead()
+        self._audio_source.close()
+
+    def __getattr__(self, name):
+        return getattr(self._audio_source, name)
+
+
 class AudioReader(DataSource):
     """
     A class to read fixed-size chunks of audio data from a source, which can
@@ -633,6 +1152,15 @@ class AudioReader(DataSource):
         Maximum duration of audio data to read (in seconds). If None (default),
         data is read until the end of the stream or, for microphone input, until
         a Ctrl-C interruption.
+    prefetch : int, optional
+        Maximum number of windows to read ahead in a background thread. If set,
+        reading the next windows from the source (e.g., waiting for microphone
+        input) overlaps with the processing of the current window. If None
+        (default), windows are read on demand in the calling thread. Call
+        `close` to stop the background thread as soon as reading is done, it
+        is otherwise stopped when the reader is garbage collected. With
+        `record=True`, only data of windows returned by `read` is recorded,
+        windows read ahead and dropped by `rewind` or `close` are not.
 
     Additional audio parameters may be required if `input` is raw audio
     (None, bytes, or raw audio file):
@@ -674,13 +1202,15 @@ class AudioReader(DataSource):
         hop_dur=None,
         record=False,
         max_read=None,
+        prefetch=None,
         **kwargs,
     ):
         if not isinstance(input, AudioSource):
             input = get_audio_source(input, **kwargs)
         self._record = record
+        recorder = None
         if record:
-            input = _Recorder(input)
+            input = recorder = _Recorder(input)
         if max_read is not None:
             input = _Limiter(input, max_read)
             self._max_read = max_read
@@ -688,28 +1218,48 @@ class AudioReader(DataSource):
             input = _FixedSizeAudioReader(input, block_dur)
         else:
             input = _OverlapAudioReader(input, block_dur, hop_dur)
+        if prefetch is not None:
+            input = _PrefetchAudioReader(input, prefetch, recorder)
 
         self._audio_source = input
+        # read is called for every window, bind it to the method that does the
+        # actual reading rather than going through each wrapper's read
+        if type(input) is _FixedSizeAudioReader:
+            self._read = partial(input._audio_source.read, input.block_size)
+        else:
+            self._read = input.read
+        # frequently used attributes, other ones are looked up by __getattr__
+        self.sr = self.sampling_rate = input.sr
+        self.sw = self.sample_width = input.sw
+        self.ch = self.channels = input.ch
+        self.block_size = input.block_size
+        if hasattr(input, "hop_size"):
+            self._hop_size = input.hop_size
+        else:
+            self._hop_size = input.block_size
+        self._block_dur = input.block_size / input.sr
+        self._hop_dur = self._hop_size / input.sr
+        # built by the first call to __repr__, none of the values it shows
+        # can change after construction
+        self._repr = None
 
     def __repr__(self):
-        block_dur, hop_dur, max_read = None, None, None
-        if self.block_dur is not None:
-            block_dur = "{:.3f}".format(self.block_dur)
-        if self.hop_dur is not None:
-            hop_dur = "{:.3f}".format(self.hop_dur)
-        if self.max_read is not None:
-            max_read = "{:.3f}".format(self.max_read)
-        return (
-            "<{cls}(block_dur={block_dur}, "
-            "hop_dur={hop_dur}, record={rewindable}, "
-            "max_read={max_read})>"
-        ).format(
-            cls=self.__class__.__name__,
-            block_dur=block_dur,
-            hop_dur=hop_dur,
-            rewindable=self._record,
-            max_read=max_read,
-        )
+        if self._repr is None:
+            max_read = self.max_read
+            if max_read is not None:
+                max_read = "{:.3f}".format(max_read)
+            self._repr = (
+                "<{cls}(block_dur={block_dur:.3f}, "
+                "hop_dur={hop_dur:.3f}, record={rewindable}, "
+                "max_read={max_read})>"
+            ).format(
+                cls=self.__class__.__name__,
+                block_dur=self._block_dur,
+                hop_dur=self._hop_dur,
+                rewindable=self._record,
+                max_read=max_read,
+            )
+        return self._repr
 
     @property
     def rewindable(self):
@@ -717,19 +1267,15 @@ class AudioReader(DataSource):
 
     @property
     def block_dur(self):
-        return self._audio_source.block_size / self._audio_source.sr
+        return self._block_dur
 
     @property
     def hop_dur(self):
-        if hasattr(self._audio_source, "hop_dur"):
-            return self._audio_source.hop_size / self._audio_source.sr
-        return self.block_dur
+        return self._hop_dur
 
     @property
     def hop_size(self):
-        if hasattr(self._audio_source, "hop_size"):
-            return self._audio_source.hop_size
-        return self.block_size
+        return self._hop_size
 
     @property
     def max_read(self):
@@ -739,7 +1285,54 @@ class AudioReader(DataSource):
             return None
 
     def read(self):
-        return self._audio_source.read()
+        return self._read()
+
+    def read_view(self):
+        """
+        Read a window of audio data and return it as a read-only `memoryview`
+        instead of a `bytes` object, or None if no more data is available.
+
+        Windows that do not overlap are read into the same buffer by all
+        calls, which saves a memory allocation per window. The returned view
+        is only valid until the next call to `read_view` (use `bytes(view)` to
+        keep a copy of its data). With Python 3.7, the view is not read-only
+        and should not be written to.
+        """
+        return self._audio_source.read_view()
+
+    def read_batch(self, nb_windows):
+        """
+        Read up to `nb_windows` consecutive windows of audio data with a single
+        read from the source, or return None if no more data is available.
+
+        Windows are the same as those returned by as many calls to
+        :meth:`read`, and reading can go on with either method. Only the last
+        batch may have fewer than `nb_windows` windows, or a last window that
+        is shorter than the others. Reading data in batches saves the cost of
+        calling :meth:`read` for each window, which is significant for short
+        windows.
+
+        Parameters
+        ----------
+        nb_windows : int
+            Maximum number of windows to read, should be >= 1.
+
+        Returns
+        -------
+        list of bytes or None
+            A list of windows of audio data, or None if no more data is
+            available.
+
+        Raises
+        ------
+        ValueError
+            If `nb_windows` is < 1.
+        """
+        if nb_windows < 1:
+            raise ValueError(
+                "nb_windows must be >= 1, given: {}".format(nb_windows)
+            )
+        return self._audio_source.read_batch(nb_windows)
 
     def __getattr__(self, name):
         if name in ("data", "rewind") and not self.rewindable:
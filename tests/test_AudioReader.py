@@ -1,4 +1,6 @@
+import gc
 import sys
+import time
 import wave
 from functools import partial
 
@@ -11,6 +13,7 @@ from auditok import (
     WaveAudioSource,
     dataset,
 )
+from auditok.io import AudioIOError
 from auditok.util import _Limiter, _OverlapAudioReader
 
 
@@ -24,6 +27,16 @@ def _read_all_data(reader):
     return b"".join(blocks)
 
 
+def _read_all_blocks(reader):
+    blocks = []
+    while True:
+        data = reader.read()
+        if data is None:
+            break
+        blocks.append(data)
+    return blocks
+
+
 class TestAudioReaderWithFileAudioSource:
     @pytest.fixture(autouse=True)
     def setup_and_teardown(self):
@@ -769,3 +782,260 @@ def test_Recorder_alias(file_id):
         assert data == expected
         assert data == reader.data
     reader.close()
+
+
+@pytest.mark.parametrize(
+    "file_id, hop_dur, prefetch",
+    [
+        ("mono_400", None, 1),  # mono
+        ("3channel_400-800-1600", None, 4),  # multichannel
+        ("mono_400", 0.05, 2),  # mono_overlap
+        ("3channel_400-800-1600", 0.05, 4),  # multichannel_overlap
+    ],
+    ids=["mono", "multichannel", "mono_overlap", "multichannel_overlap"],
+)
+def test_AudioReader_prefetch(file_id, hop_dur, prefetch):
+    input_wav = "tests/data/test_16KHZ_{}Hz.wav".format(file_id)
+    reader = AudioReader(input_wav, block_dur=0.1, hop_dur=hop_dur)
+    reader.open()
+    expected = _read_all_blocks(reader)
+    reader.close()
+
+    reader = AudioReader(
+        input_wav,
+        block_dur=0.1,
+        hop_dur=hop_dur,
+        record=True,
+        prefetch=prefetch,
+    )
+    assert reader.hop_dur == (0.1 if hop_dur is None else hop_dur)
+    with pytest.raises(AudioIOError):
+        reader.read()
+    reader.open()
+    assert _read_all_blocks(reader) == expected
+    # reading past the end of the stream keeps returning None
+    assert reader.read() is None
+    reader.rewind()
+    assert _read_all_blocks(reader) == expected
+    # rewind while the thread is reading ahead
+    reader.read()
+    reader.rewind()
+    assert _read_all_blocks(reader) == expected
+    reader.close()
+
+
+@pytest.mark.parametrize(
+    "hop_dur, recorded_size",
+    [
+        (None, 320 * 3),  # fixed
+        (0.005, 320 + 160 * 2),  # overlap
+    ],
+    ids=["fixed", "overlap"],
+)
+def test_AudioReader_prefetch_record_partial_read(hop_dur, recorded_size):
+    data = bytes(range(256)) * 25
+    reader = AudioReader(
+        BufferAudioSource(data, 16000, 2, 1), block_dur=0.01, hop_dur=hop_dur
+    )
+    reader.open()
+    expected = _read_all_blocks(reader)[:3]
+    reader.close()
+
+    reader = AudioReader(
+        BufferAudioSource(data, 16000, 2, 1),
+        block_dur=0.01,
+        hop_dur=hop_dur,
+        record=True,
+        prefetch=4,
+    )
+    reader.open()
+    windows = [reader.read() for _ in range(3)]
+    # let the background thread read windows that are never returned
+    while not reader._audio_source._queue.full():
+        time.sleep(0.001)
+    reader.rewind()
+    assert windows == expected
+    assert reader.data == data[:recorded_size]
+    assert _read_all_blocks(reader) == expected
+    reader.close()
+
+
+def test_AudioReader_prefetch_not_closed():
+    # a reader that is dropped without being closed must not keep its
+    # background thread (and thus its source) alive
+    reader = AudioReader(
+        BufferAudioSource(b"\0" * 32000, 16000, 2, 1),
+        block_dur=0.01,
+        prefetch=1,
+    )
+    reader.open()
+    reader.read()
+    thread = reader._audio_source._thread
+    assert thread.is_alive()
+    del reader
+    gc.collect()
+    thread.join(timeout=2)
+    assert not thread.is_alive()
+
+
+@pytest.mark.parametrize(
+    "input, hop_dur, record, max_read",
+    [
+        ("buffer", None, False, None),  # buffer
+        ("raw", None, False, None),  # raw_file
+        ("wav", None, False, None),  # wave_file
+        ("buffer", None, True, None),  # buffer_record
+        ("buffer", None, True, 0.5),  # buffer_record_max_read
+        ("buffer", 0.007, False, None),  # buffer_overlap
+    ],
+    ids=[
+        "buffer",
+        "raw_file",
+        "wave_file",
+        "buffer_record",
+        "buffer_record_max_read",
+        "buffer_overlap",
+    ],
+)
+def test_AudioReader_read_view(input, hop_dur, record, max_read):
+    filename = "tests/data/test_16KHZ_3channel_400-800-1600Hz.{}"
+    with open(filename.format("raw"), "rb") as fp:
+        data = fp.read()
+    input = data if input == "buffer" else filename.format(input)
+    if max_read is not None:
+        data = data[: int(max_read * 16000) * 2 * 3]
+    reader = AudioReader(
+        BufferAudioSource(data, 16000, 2, 3), block_dur=0.03, hop_dur=hop_dur
+    )
+    reader.open()
+    expected = _read_all_blocks(reader)
+    reader.close()
+
+    reader = AudioReader(
+        input,
+        block_dur=0.03,
+        hop_dur=hop_dur,
+        record=record,
+        max_read=max_read,
+        sr=16000,
+        sw=2,
+        ch=3,
+    )
+    reader.open()
+    views = []
+    while True:
+        view = reader.read_view()
+        if view is None:
+            break
+        assert view.readonly or sys.version_info < (3, 8)
+        views.append(bytes(view))
+    assert views == expected
+    if record:
+        reader.rewind()
+        assert reader.data == data
+        assert [bytes(reader.read_view()) for _ in expected] == expected
+    reader.close()
+
+
+@pytest.mark.parametrize(
+    "reader_class, kwargs, expected",
+    [
+        (
+            AudioReader,
+            {},
+            "<AudioReader(block_dur=0.010, hop_dur=0.010, record=False, "
+            "max_read=None)>",
+        ),  # default
+        (
+            AudioReader,
+            {"block_dur": 0.02, "hop_dur": 0.01, "record": True},
+            "<AudioReader(block_dur=0.020, hop_dur=0.010, record=True, "
+            "max_read=None)>",
+        ),  # overlap_record
+        (
+            Recorder,
+            {"max_read": 0.5},
+            "<Recorder(block_dur=0.010, hop_dur=0.010, record=True, "
+            "max_read=0.500)>",
+        ),  # recorder_max_read
+    ],
+    ids=["default", "overlap_record", "recorder_max_read"],
+)
+def test_AudioReader_repr(reader_class, kwargs, expected):
+    reader = reader_class(
+        BufferAudioSource(b"\0" * 32000, 16000, 2, 1), **kwargs
+    )
+    assert repr(reader) == expected
+    reader.open()
+    reader.read()
+    assert repr(reader) == expected
+    reader.close()
+
+
+@pytest.mark.parametrize(
+    "hop_dur, record, max_read, prefetch, nb_windows",
+    [
+        (None, False, None, None, 1),  # one_window
+        (None, False, None, None, 7),  # fixed
+        (None, True, 0.5, None, 7),  # record_max_read
+        (0.007, False, None, None, 1),  # overlap_one_window
+        (0.007, False, None, None, 7),  # overlap
+        (0.007, True, 0.5, None, 7),  # overlap_record_max_read
+        (None, False, None, 2, 7),  # prefetch
+    ],
+    ids=[
+        "one_window",
+        "fixed",
+        "record_max_read",
+        "overlap_one_window",
+        "overlap",
+        "overlap_record_max_read",
+        "prefetch",
+    ],
+)
+def test_AudioReader_read_batch(
+    hop_dur, record, max_read, prefetch, nb_windows
+):
+    with open("tests/data/test_16KHZ_3channel_400-800-1600Hz.raw", "rb") as fp:
+        data = fp.read()
+    if max_read is not None:
+        data = data[: int(max_read * 16000) * 2 * 3]
+    reader = AudioReader(
+        BufferAudioSource(data, 16000, 2, 3), block_dur=0.03, hop_dur=hop_dur
+    )
+    reader.open()
+    expected = _read_all_blocks(reader)
+    reader.close()
+
+    reader = AudioReader(
+        BufferAudioSource(data, 16000, 2, 3),
+        block_dur=0.03,
+        hop_dur=hop_dur,
+        record=record,
+        max_read=max_read,
+        prefetch=prefetch,
+    )
+    reader.open()
+    # alternate batches and single windows
+    windows = reader.read_batch(nb_windows)
+    assert len(windows) == nb_windows
+    windows.append(reader.read())
+    while True:
+        batch = reader.read_batch(nb_windows)
+        if batch is None:
+            break
+        assert 1 <= len(batch) <= nb_windows
+        windows.extend(batch)
+    assert windows == expected
+    assert reader.read() is None
+    if record:
+        reader.rewind()
+        assert reader.data == data
+    reader.close()
+
+
+def test_AudioReader_read_batch_exception():
+    reader = AudioReader(BufferAudioSource(b"\0" * 320, 16000, 2, 1))
+    with pytest.raises(ValueError) as val_err:
+        reader.read_batch(0)
+    assert str(val_err.value) == "nb_windows must be >= 1, given: 0"
@@ -2,7 +2,9 @@
 @author: Amine Sehili <amine.sehili@gmail.com>
 """
 
+import mmap
 from array import array
+from unittest.mock import patch
 
 import numpy as np
 import pytest
@@ -146,6 +148,22 @@ def test_RawAudioSource(file_suffix, frequencies):
     assert data_read_all == expected
 
 
+def test_RawAudioSource_not_mappable():
+    file = "tests/data/test_16KHZ_mono_400Hz.raw"
+    with open(file, "rb") as fp:
+        expected = fp.read()
+    audio_source = RawAudioSource(file, 16000, 2, 1)
+    # fall back to reading from the file, e.g. for a pipe
+    with patch("mmap.mmap", side_effect=OSError):
+        audio_source.open()
+    assert not isinstance(audio_source._audio_stream, mmap.mmap)
+    buffer = bytearray(1000)
+    size = audio_source.readinto(buffer)
+    data = bytes(buffer[:size]) + audio_source.read(None)
+    audio_source.close()
+    assert data == expected
+
+
 @pytest.mark.parametrize(
     "file_suffix, frequencies",
     [
@@ -181,6 +199,43 @@ def test_WaveAudioSource(file_suffix, frequencies):
     assert data_read_all == expected
 
 
+@pytest.mark.parametrize(
+    "source_type, buffer_size",
+    [
+        ("buffer", 960),  # buffer
+        ("raw", 960),  # raw
+        ("wave", 960),  # wave
+        ("raw", 1001),  # raw_partial_sample
+    ],
+    ids=["buffer", "raw", "wave", "raw_partial_sample"],
+)
+def test_AudioSource_readinto(source_type, buffer_size):
+    file = "tests/data/test_16KHZ_3channel_400-800-1600Hz"
+    with open(file + ".raw", "rb") as fp:
+        expected = fp.read()
+    if source_type == "buffer":
+        audio_source = BufferAudioSource(expected, 16000, 2, 3)
+    elif source_type == "raw":
+        audio_source = RawAudioSource(file + ".raw", 16000, 2, 3)
+    else:
+        audio_source = WaveAudioSource(file + ".wav")
+
+    buffer = bytearray(buffer_size)
+    with pytest.raises(AudioIOError):
+        audio_source.readinto(buffer)
+    audio_source.open()
+    blocks = []
+    while True:
+        size = audio_source.readinto(buffer)
+        if not size:
+            break
+        # only whole samples of all channels are read
+        assert size % 6 == 0
+        blocks.append(bytes(buffer[:size]))
+    audio_source.close()
+    assert b"".join(blocks) == expected
+
+
 class TestBufferAudioSource_SR10_SW1_CH1:
     @pytest.fixture(autouse=True)
     def setup_and_teardown(self):
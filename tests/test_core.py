@@ -22,6 +22,7 @@ from auditok.core import (
     _make_audio_region,
     _read_chunks_online,
     _read_offline,
+    _resolve_aliases,
 )
 from auditok.io import get_audio_source
 from auditok.signal import to_array
@@ -211,6 +212,33 @@ def test_duration_to_nb_windows(
         assert result == expected
 
 
+@pytest.mark.parametrize(
+    "kwargs, expected",
+    [
+        ({}, {}),  # empty
+        (
+            {"aw": 0.1, "eth": 60},
+            {"analysis_window": 0.1, "energy_threshold": 60},
+        ),  # short_names
+        ({"mr": 2, "max_read": 3}, {"max_read": 3}),  # long_name_precedence
+        (
+            {"uc": None, "sr": 8000},
+            {"use_channel": None, "sr": 8000},
+        ),  # other_kwargs_kept
+    ],
+    ids=[
+        "empty",
+        "short_names",
+        "long_name_precedence",
+        "other_kwargs_kept",
+    ],
+)
+def test_resolve_aliases(kwargs, expected):
+    kwargs_copy = kwargs.copy()
+    assert _resolve_aliases(kwargs) == expected
+    assert kwargs == kwargs_copy
+
+
 @pytest.mark.parametrize(
     "channels, skip, max_read",
     [
@@ -92,3 +92,14 @@ def test_to_array(setup_data, sample_width, expected):
 def test_calculate_energy(x, aggregation_fn, expected):
     energy = signal.calculate_energy(x, aggregation_fn)
     assert (energy == expected).all()
+
+
+@pytest.mark.parametrize(
+    "dtype",
+    [np.int16, np.float32, np.float64, np.longdouble],
+    ids=["int16", "float32", "float64", "longdouble"],
+)
+def test_calculate_energy_dtype(dtype):
+    x = np.array([300, 320, 400, 600], dtype=dtype)
+    energy = signal.calculate_energy(x)
+    assert energy == 52.506639194632434
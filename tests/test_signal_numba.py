@@ -0,0 +1,76 @@
+import math
+
+import numpy as np
+import pytest
+
+pytest.importorskip("numba")
+
+from auditok import signal_numba  # noqa: E402
+
+
+@pytest.mark.parametrize(
+    "x, expected",
+    [
+        ([[300], [320], [400], [600]], 178100.0),  # mono
+        (
+            [[300, 150], [320, 160], [400, 200], [600, 300]],
+            178100.0,
+        ),  # stereo_first_highest
+        (
+            [[150, 300], [160, 320], [200, 400], [300, 600]],
+            178100.0,
+        ),  # stereo_second_highest
+        ([[0, 0], [0, 0]], 0.0),  # zeros
+    ],
+    ids=[
+        "mono",
+        "stereo_first_highest",
+        "stereo_second_highest",
+        "zeros",
+    ],
+)
+@pytest.mark.parametrize("dtype", [np.int16, np.int32])
+def test_max_channel_mean_square(x, expected, dtype):
+    result = signal_numba.max_channel_mean_square(np.array(x, dtype=dtype))
+    assert result == pytest.approx(expected)
+
+
+def test_max_channel_mean_square_int8():
+    x = np.array([[-128, 10], [127, -10]], dtype=np.int8)
+    result = signal_numba.max_channel_mean_square(x)
+    assert result == pytest.approx((128**2 + 127**2) / 2)
+
+
+@pytest.mark.parametrize(
+    "x, expected",
+    [
+        ([[300], [320], [400], [600]], 178100.0),  # mono
+        (
+            [[300, 100], [320, 120], [400, 200], [600, 200]],
+            84600.0,
+        ),  # stereo
+        ([[634, 0], [634, 0]], 100489.0),  # stereo_null_channel
+        ([[-300, 300], [300, -300]], 0.0),  # opposite_channels
+    ],
+    ids=[
+        "mono",
+        "stereo",
+        "stereo_null_channel",
+        "opposite_channels",
+    ],
+)
+def test_mix_mean_square(x, expected):
+    result = signal_numba.mix_mean_square(np.array(x, dtype=np.int16))
+    assert result == pytest.approx(expected)
+
+
+@pytest.mark.parametrize(
+    "kernel",
+    [
+        signal_numba.max_channel_mean_square,
+        signal_numba.mix_mean_square,
+    ],
+    ids=["max_channel_mean_square", "mix_mean_square"],
+)
+def test_mean_square_empty(kernel):
+    assert math.isnan(kernel(np.zeros((0, 2), dtype=np.int16)))
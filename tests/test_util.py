@@ -9,6 +9,8 @@ from auditok import signal
 from auditok.exceptions import TimeFormatError
 from auditok.util import (
     AudioEnergyValidator,
+    AudioReader,
+    _load_signal_numba,
     make_channel_selector,
     make_duration_formatter,
 )
@@ -60,6 +62,12 @@ def test_make_duration_formatter(fmt, duration, expected):
     assert result == expected
 
 
+def test_make_duration_formatter_cached():
+    formatter = make_duration_formatter("%h:%m:%s.%i")
+    assert make_duration_formatter("%h:%m:%s.%i") is formatter
+    assert make_duration_formatter("%h:%m:%s") is not formatter
+
+
 @pytest.mark.parametrize(
     "fmt",
     [
@@ -234,6 +242,39 @@ def test_make_channel_selector_any(
     assert (result == expected).all()
 
 
+@pytest.mark.parametrize(
+    "sample_width, channels, selected",
+    [
+        (1, 1, None),  # int8_1channel
+        (2, 2, 0),  # int16_2channel_select_0
+        (2, 3, -1),  # int16_3channel_select_last
+        (4, 3, "any"),  # int32_3channel_any
+    ],
+    ids=[
+        "int8_1channel",
+        "int16_2channel_select_0",
+        "int16_3channel_select_last",
+        "int32_3channel_any",
+    ],
+)
+def test_make_channel_selector_no_copy(
+    setup_data, sample_width, channels, selected
+):
+    selector = make_channel_selector(sample_width, channels, selected)
+    result = selector(setup_data)
+    assert result.dtype == signal.SAMPLE_WIDTH_TO_DTYPE[sample_width]
+    assert not result.flags.owndata
+    assert not result.flags.writeable
+
+
+def test_make_channel_selector_cached():
+    selector = make_channel_selector(2, 2, "mix")
+    assert make_channel_selector(2, 2, "avg") is selector
+    assert make_channel_selector(2, 2, 0) is not selector
+    assert make_channel_selector(2, 2, -2) is make_channel_selector(2, 2, 0)
+    assert make_channel_selector(2, 1, 0) is make_channel_selector(2, 1)
+
+
 class TestAudioEnergyValidator:
     @pytest.mark.parametrize(
         "data, channels, use_channel, expected",
@@ -290,18 +331,167 @@ class TestAudioEnergyValidator:
             "zeros",
         ],
     )
+    @pytest.mark.parametrize(
+        "use_numba",
+        [
+            False,
+            pytest.param(
+                True,
+                marks=pytest.mark.skipif(
+                    _load_signal_numba() is None, reason="numba not installed"
+                ),
+            ),
+        ],
+        ids=["numpy", "numba"],
+    )
     def test_audio_energy_validator(
-        self, data, channels, use_channel, expected
+        self, data, channels, use_channel, expected, use_numba
     ):
 
         data = array_("h", data)
         sample_width = 2
         energy_threshold = 50
         validator = AudioEnergyValidator(
-            energy_threshold, sample_width, channels, use_channel
+            energy_threshold,
+            sample_width,
+            channels,
+            use_channel,
+            use_numba=use_numba,
         )
 
         if expected:
             assert validator.is_valid(data)
         else:
             assert not validator.is_valid(data)
+
+    @pytest.mark.parametrize(
+        "data, sample_width, energy_threshold, expected",
+        [
+            ([0, 0, 0, 0], 2, -200, True),  # zeros_clipped_energy
+            ([0, 0, 0, 0], 2, -199, False),  # zeros_above_clipped_energy
+            ([10, -10, 10, -10], 1, 20, True),  # int8_valid
+            ([10, -10, 10, -10], 1, 20.1, False),  # int8_invalid
+            ([2**20, -(2**20)], 4, 120, True),  # int32_valid
+            ([2**20, -(2**20)], 4, 121, False),  # int32_invalid
+            ([32767, 32767], 2, 10000, False),  # huge_threshold
+        ],
+        ids=[
+            "zeros_clipped_energy",
+            "zeros_above_clipped_energy",
+            "int8_valid",
+            "int8_invalid",
+            "int32_valid",
+            "int32_invalid",
+            "huge_threshold",
+        ],
+    )
+    def test_audio_energy_validator_threshold(
+        self, data, sample_width, energy_threshold, expected
+    ):
+        fmt = {1: "b", 2: "h", 4: "i"}[sample_width]
+        data = array_(fmt, data)
+        validator = AudioEnergyValidator(energy_threshold, sample_width, 1)
+        assert validator.is_valid(data) is expected
+        log_energy = signal.calculate_energy(
+            signal.to_array(data, sample_width, 1), max
+        )
+        assert bool(log_energy >= energy_threshold) is expected
+
+    @pytest.mark.parametrize(
+        "sample_width, channels, use_channel",
+        [
+            (2, 1, None),  # mono
+            (1, 2, None),  # int8_stereo_uc_None
+            (2, 2, 1),  # stereo_uc_1
+            (2, 3, "mix"),  # 3channel_uc_mix
+            (4, 3, "any"),  # int32_3channel_uc_any
+            (4, 2, -2),  # int32_stereo_uc_minus_2
+        ],
+        ids=[
+            "mono",
+            "int8_stereo_uc_None",
+            "stereo_uc_1",
+            "3channel_uc_mix",
+            "int32_3channel_uc_any",
+            "int32_stereo_uc_minus_2",
+        ],
+    )
+    def test_audio_energy_validator_get_log_energy(
+        self, sample_width, channels, use_channel
+    ):
+        dtype = signal.SAMPLE_WIDTH_TO_DTYPE[sample_width]
+        max_value = np.iinfo(dtype).max
+        rng = np.random.default_rng(42)
+        data = rng.integers(-max_value, max_value, 120, dtype=dtype).tobytes()
+        validator = AudioEnergyValidator(
+            50, sample_width, channels, use_channel
+        )
+        selector = make_channel_selector(sample_width, channels, use_channel)
+        expected = signal.calculate_energy(selector(data), np.max)
+        assert validator.get_log_energy(data) == pytest.approx(expected)
+
+    @pytest.mark.parametrize(
+        "channels, use_channel, block_size, hop_size",
+        [
+            (1, None, 16, None),  # mono
+            (1, None, 16, 6),  # mono_overlap
+            (2, None, 10, 4),  # stereo_uc_None_overlap
+            (2, 1, 16, None),  # stereo_uc_1
+            (3, "mix", 12, 5),  # 3channel_uc_mix_overlap
+        ],
+        ids=[
+            "mono",
+            "mono_overlap",
+            "stereo_uc_None_overlap",
+            "stereo_uc_1",
+            "3channel_uc_mix_overlap",
+        ],
+    )
+    def test_audio_energy_validator_is_valid_batch(
+        self, channels, use_channel, block_size, hop_size
+    ):
+        rng = np.random.default_rng(42)
+        # segments of 20 samples with a low or high energy
+        scale = np.repeat(rng.choice([10, 1000], size=10), 20)[:, None]
+        samples = rng.standard_normal((200, channels)) * scale
+        data = samples.astype(np.int16).tobytes()
+        validator = AudioEnergyValidator(40, 2, channels, use_channel)
+        reader = AudioReader(
+            data,
+            block_dur=block_size / 1000,
+            hop_dur=None if hop_size is None else hop_size / 1000,
+            sr=1000,
+            sw=2,
+            ch=channels,
+        )
+        reader.open()
+        expected = []
+        while True:
+            block = reader.read()
+            if block is None:
+                break
+            expected.append(validator.is_valid(block))
+        reader.close()
+        result = validator.is_valid_batch(data, block_size, hop_size)
+        assert result.tolist() == expected
+        assert any(expected) and not all(expected)
+
+    def test_audio_energy_validator_is_valid_batch_exception(self):
+        validator = AudioEnergyValidator(40, 2, 1)
+        assert validator.is_valid_batch(b"", 10).size == 0
+        with pytest.raises(ValueError):
+            validator.is_valid_batch(b"\0" * 20, 5, 6)
+
+    def test_audio_energy_validator_use_numba_not_installed(self):
+        with patch("auditok.util._load_signal_numba", return_value=None):
+            # not needed for one channel
+            AudioEnergyValidator(50, 2, 2, use_channel=0, use_numba=True)
+            with pytest.raises(ImportError) as imp_err:
+                AudioEnergyValidator(50, 2, 2, use_numba=True)
+        assert str(imp_err.value) == (
+            "numba is required when 'use_numba' is True"
+        )
+
+    def test_audio_energy_validator_get_log_energy_zeros(self):
+        validator = AudioEnergyValidator(50, 2, 2)
+        assert validator.get_log_energy(b"\0" * 16) == pytest.approx(-200)